@@ -3,6 +3,10 @@
 Generate skills quick reference from skill frontmatter.
 Scans skills/ directory and extracts metadata from SKILL.md files.
 
+Frontmatter is read with a small parser specialized for the schema below.
+Pass --strict to parse it with pyyaml instead (falls back to the built-in
+parser when pyyaml is not installed or rejects the block).
+
 New schema fields:
 - name: Skill identifier
 - description: WHAT the skill does (method/technique)
@@ -14,11 +18,16 @@ New schema fields:
 - related.complementary: Skills that pair well
 """
 
+import argparse
+import io
+import json
 import os
 import re
 import sys
+from functools import partial
+from itertools import groupby
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 # Category patterns for grouping skills
 CATEGORIES = {
@@ -29,23 +38,63 @@ CATEGORIES = {
     'Meta Skills': [r'^using-', r'^writing-skills$', r'^testing-skills', r'^testing-agents'],
 }
 
-try:
-    import yaml
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
-    print("Warning: pyyaml not installed, using fallback parser", file=sys.stderr)
+# Compiled once at import so categorization does no per-call pattern lookups.
+# Kept as a per-category loop: folding the categories into one alternation
+# needs a lookahead per category to preserve their priority, and rescanning
+# the name for each one is slower than these short searches.
+CATEGORIES_COMPILED = [
+    (category, [re.compile(pattern) for pattern in patterns])
+    for category, patterns in CATEGORIES.items()
+]
+
+# Built-in parser: known top-level field names (prevents false matches on
+# "error:" etc in values)
+_SIMPLE_FIELDS = ('name', 'description', 'trigger', 'skip_when', 'when_to_use')
+_NESTED_FIELDS = ('sequence', 'related')
+_TOP_LEVEL_FIELDS = frozenset(_SIMPLE_FIELDS + _NESTED_FIELDS)
+
+# pyyaml is only used by --strict, so it is imported on demand by load_yaml()
+# rather than on every run
+_yaml: Any = None
+_YamlLoader: Any = None
+
+# Bump when the cached skill format or parsing rules change
+CACHE_VERSION = 2
+
+
+def load_yaml() -> bool:
+    """Import pyyaml for --strict parsing. Returns whether it is available."""
+    global _yaml, _YamlLoader
+    if _yaml is None:
+        try:
+            import yaml
+        except ImportError:
+            return False
+        # libyaml-backed loader when PyYAML was built with it
+        _YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        _yaml = yaml
+    return True
+
+
+def _parser_id(strict: bool) -> str:
+    """Name of the frontmatter parser in use, recorded in the parse cache."""
+    return 'yaml' if strict and _yaml is not None else 'builtin'
 
 
 class Skill:
     """Represents a skill with its metadata."""
 
+    __slots__ = ('name', 'description', 'directory', 'trigger', 'skip_when',
+                 'sequence', 'related', 'category', 'short_description')
+
     def __init__(self, name: str, description: str, directory: str,
                  trigger: str = "", skip_when: str = "",
                  sequence: Optional[Dict[str, List[str]]] = None,
                  related: Optional[Dict[str, List[str]]] = None):
         self.name = name
         self.description = description
+        # First meaningful line of the description, as shown in the reference
+        self.short_description = first_line(description)
         self.directory = directory
         self.trigger = trigger
         self.skip_when = skip_when
@@ -55,133 +104,379 @@ class Skill:
 
     def _categorize(self) -> str:
         """Determine skill category based on directory name."""
-        for category, patterns in CATEGORIES.items():
+        for category, patterns in CATEGORIES_COMPILED:
             for pattern in patterns:
-                if re.search(pattern, self.directory):
+                if pattern.search(self.directory):
                     return category
         return 'Other'
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Constructor arguments for this skill, used by the parse cache."""
+        return {
+            'name': self.name,
+            'description': self.description,
+            'directory': self.directory,
+            'trigger': self.trigger,
+            'skip_when': self.skip_when,
+            'sequence': self.sequence,
+            'related': self.related,
+        }
+
     def __repr__(self):
         return f"Skill(name={self.name}, category={self.category})"
 
 
 def first_line(text: str) -> str:
-    """Extract first meaningful line from multi-line text."""
+    """Extract first meaningful line from multi-line text.
+
+    Walks the text line by line with str.find and stops at the first hit,
+    so only the leading part of a long description is touched.
+    """
     if not text:
         return ""
-    # Remove leading/trailing whitespace, take first line
-    lines = text.strip().split('\n')
-    for line in lines:
-        line = line.strip()
+    start, length = 0, len(text)
+    while start < length:
+        end = text.find('\n', start)
+        if end < 0:
+            end = length
+        line = text[start:end].strip()
+        if line.startswith('- '):
+            return line[2:]  # Return first list item without marker
         # Skip list markers and empty lines
         if line and not line.startswith('-'):
             return line
-        elif line.startswith('- '):
-            return line[2:]  # Return first list item without marker
-    return lines[0].strip() if lines else ""
+        start = end + 1
+    return text.lstrip().partition('\n')[0].strip()
 
 
-def parse_frontmatter_yaml(content: str) -> Optional[Dict[str, Any]]:
-    """Parse YAML frontmatter using pyyaml library."""
-    if not YAML_AVAILABLE:
+def _extract_frontmatter(content: str) -> Optional[str]:
+    """Return the raw text between the opening and closing --- delimiters.
+
+    Uses plain string searches instead of a DOTALL regex over the whole file.
+    Returns None if the content does not start with a frontmatter block.
+    """
+    if not content.startswith('---'):
         return None
+    nl = content.find('\n', 3)
+    if nl < 0 or content[3:nl].strip():
+        return None
+
+    # Closing delimiter is a line holding only --- (plus trailing whitespace)
+    end = content.find('\n---', nl)
+    while end >= 0:
+        line_end = content.find('\n', end + 4)
+        rest = content[end + 4:line_end] if line_end >= 0 else content[end + 4:]
+        if not rest.strip():
+            return content[nl + 1:end]
+        end = content.find('\n---', end + 1)
+    return None
 
-    # Extract frontmatter between --- delimiters
-    match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-    if not match:
+
+def read_frontmatter_head(path: Path, chunk_size: int = 8192) -> str:
+    """Read only as much of a file as needed to cover its frontmatter block.
+
+    Reads in chunks until the closing --- line is complete or EOF, so long
+    skill bodies are never loaded.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read(chunk_size)
+        if not content.startswith('---'):
+            return content
+        while True:
+            # Only complete lines count: a chunk may end mid-delimiter
+            if _extract_frontmatter(content[:content.rfind('\n') + 1]) is not None:
+                return content
+            more = f.read(chunk_size)
+            if not more:
+                return content
+            content += more
+
+
+def parse_frontmatter_yaml(frontmatter_text: str) -> Optional[Dict[str, Any]]:
+    """Parse an extracted frontmatter block using pyyaml library.
+
+    Returns None unless load_yaml() has imported pyyaml.
+    """
+    if _yaml is None:
         return None
 
     try:
-        frontmatter = yaml.safe_load(match.group(1))
+        frontmatter = _yaml.load(frontmatter_text, Loader=_YamlLoader)
         return frontmatter if isinstance(frontmatter, dict) else None
-    except yaml.YAMLError as e:
+    except _yaml.YAMLError as e:
         print(f"Warning: YAML parse error: {e}", file=sys.stderr)
         return None
 
 
-def parse_frontmatter_fallback(content: str) -> Optional[Dict[str, Any]]:
-    """Fallback parser using regex when pyyaml unavailable.
+_DQ_ESCAPES = {'n': '\n', 't': '\t', '"': '"', '\\': '\\', '/': '/', '0': '\0', ' ': ' '}
+_DQ_ESCAPE_RE = re.compile(r'\\(.)')
+
+
+def _strip_comment(text: str) -> Tuple[str, bool]:
+    """Split a plain scalar line at its first " #" comment, if any."""
+    if text.startswith('#'):
+        return '', True
+    for marker in (' #', '\t#'):
+        at = text.find(marker)
+        if at >= 0:
+            return text[:at].rstrip(), True
+    return text, False
+
 
-    Handles:
+def _fold_plain(first: str, lines: List[str]) -> str:
+    """Fold a multi-line plain scalar: line breaks become spaces, blank lines
+    newlines. A comment ends the value.
+    """
+    out = first
+    breaks = 0
+    for raw in lines:
+        text = raw.strip()
+        if not text:
+            breaks += 1
+            continue
+        text, done = _strip_comment(text)
+        if not text:
+            # Comment lines may precede the value; after it they end it
+            if out:
+                break
+            continue
+        if out:
+            out += '\n' * breaks if breaks else ' '
+        out += text
+        breaks = 0
+        if done:
+            break
+    return out
+
+
+def _closing_quote(text: str, quote: str) -> int:
+    """Index of the quote that ends a quoted scalar's text, or -1."""
+    pos = 0
+    while True:
+        close = text.find(quote, pos)
+        if close < 0:
+            return -1
+        if quote == "'":
+            if not text.startswith("''", close):
+                return close
+            pos = close + 2
+        else:
+            backslashes = len(text[:close]) - len(text[:close].rstrip('\\'))
+            if not backslashes % 2:
+                return close
+            pos = close + 1
+
+
+def _quoted_scalar(header: str, lines: List[str]) -> str:
+    """Value of a single- or double-quoted scalar, possibly spanning lines."""
+    quote = header[0]
+    text = header[1:]
+    close = _closing_quote(text, quote)
+    breaks = 0
+    remaining = iter(lines)
+    while close < 0:
+        raw = next(remaining, None)
+        if raw is None:
+            # Unterminated: keep what there is rather than dropping the field
+            return text.strip()
+        line = raw.strip()
+        if not line:
+            breaks += 1
+            continue
+        text = text.rstrip(' \t') + ('\n' * breaks if breaks else ' ') + line
+        breaks = 0
+        close = _closing_quote(text, quote)
+
+    if quote == "'":
+        return text[:close].replace("''", "'")
+    return _DQ_ESCAPE_RE.sub(lambda m: _DQ_ESCAPES.get(m.group(1), m.group(0)), text[:close])
+
+
+def _block_scalar(header: str, lines: List[str], at_end: bool) -> str:
+    """Value of a literal (|) or folded (>) block scalar.
+
+    at_end tells whether lines run to the end of the frontmatter, in which
+    case the last line has no line break after it.
+    """
+    indicator = header.partition('#')[0].strip()
+    folded = indicator[0] == '>'
+    chomp = '-' if '-' in indicator else '+' if '+' in indicator else ''
+
+    # Indentation is set by the first non-blank line
+    indent = next((len(line) - len(line.lstrip()) for line in lines if line.strip()), 0)
+    content = []
+    for line in lines:
+        if not line.strip():
+            # Whitespace past the indentation is part of the content
+            content.append(line[indent:])
+        elif len(line) - len(line.lstrip()) < indent:
+            at_end = False
+            break
+        else:
+            content.append(line[indent:])
+    trailing = len(content)
+    while trailing and not content[trailing - 1]:
+        trailing -= 1
+    # Line breaks after the last content line
+    breaks_after = len(content) - trailing + (0 if at_end else 1)
+    content = content[:trailing]
+
+    if not folded:
+        text = '\n'.join(content)
+    else:
+        # Adjacent lines join with a space; blank and more-indented lines keep breaks
+        text = ''
+        breaks = 0
+        prev_more = False
+        for line in content:
+            if not line:
+                breaks += 1
+                continue
+            more = line[0] in (' ', '\t')
+            if not text and not breaks:
+                text = line
+            elif more or prev_more:
+                text += '\n' * (breaks + 1)
+                text += line
+            else:
+                text += ('\n' * breaks if breaks else ' ') + line
+            prev_more = more
+            breaks = 0
+
+    if not content or chomp == '-':
+        return text
+    return text + '\n' * (breaks_after if chomp == '+' else min(breaks_after, 1))
+
+
+def _scalar_value(header: str, lines: List[str], at_end: bool = False) -> str:
+    """Value of a simple field from its inline text and continuation lines.
+
+    Follows YAML for plain, quoted and block scalars. A sequence is reduced
+    to its first item, since only a one-line summary is shown.
+    """
+    header = header.strip()
+    if not header or header.startswith('#'):
+        # Value starts on a following line
+        for at, line in enumerate(lines):
+            text = line.strip()
+            if text and not text.startswith('#'):
+                header, lines = text, lines[at + 1:]
+                break
+        else:
+            return ''
+        if header == '-' or header.startswith('- '):
+            return _strip_comment(header[1:].strip())[0]
+    if header[:1] in ('|', '>'):
+        return _block_scalar(header, lines, at_end)
+    if header[:1] in ('"', "'"):
+        return _quoted_scalar(header, lines)
+    header, done = _strip_comment(header)
+    return header if done else _fold_plain(header, lines)
+
+
+def parse_frontmatter_fallback(frontmatter_text: str) -> Optional[Dict[str, Any]]:
+    """Built-in parser for an extracted frontmatter block (default parser).
+
+    Single pass over the lines of the block. Handles:
     - Simple scalar fields: name, description, trigger, skip_when, when_to_use
-    - Multi-line block scalars (|) - extracts first meaningful line
+    - Plain, quoted ("..." or '...') and block (|, >) scalars, folded and
+      unescaped as YAML does, with trailing comments removed
     - Nested structures: sequence, related - parses sub-fields with arrays
+
+    Known gaps compared to pyyaml (use --strict where they matter):
+    - Block-sequence items ("- a" lines) under sequence/related sub-fields
+      are dropped; only flow lists ([a, b]) are read
+    - Scalars are never typed: null and ~ come back as the strings 'null'
+      and '~', and dates, numbers and booleans stay strings
     """
-    match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-    if not match:
-        return None
+    result: Dict[str, Any] = {}
+    seen = set()
+    nested = None       # sub-field dict of the nested block being read
+    in_block = False    # whether the nested block's indented lines have started
+    nested_seen = set()
+
+    lines = frontmatter_text.split('\n')
+    index, count = 0, len(lines)
+    while index < count:
+        line = lines[index]
+        index += 1
+
+        # Known top-level field at column 0 ends whatever came before it
+        key, sep, value = line.partition(':')
+        if sep and key in _TOP_LEVEL_FIELDS:
+            nested = None
+            if key in seen:
+                continue
+            seen.add(key)
+            if key in _SIMPLE_FIELDS:
+                # The value runs on over blank and indented lines
+                end = index
+                while end < count and (not lines[end].strip() or lines[end][:1] in (' ', '\t', '#')):
+                    end += 1
+                # Quoted values may also continue on unindented lines
+                first = value.strip()
+                if not first or first.startswith('#'):
+                    first = next((text for text in (line.strip() for line in lines[index:end])
+                                  if text and not text.startswith('#')), '')
+                quoted = first[:1] in ('"', "'")
+                scalar = _scalar_value(value, lines[index:] if quoted else lines[index:end], end == count)
+                if scalar.strip():
+                    result[key] = scalar
+                index = end
+            elif not value.strip():
+                nested = result[key] = {}
+                in_block = False
+                nested_seen = set()
+            continue
+
+        if nested is not None:
+            if line[:1] not in (' ', '\t'):
+                # Blank lines may precede the block; anything else ends it
+                if in_block or line.strip():
+                    nested = None
+                continue
+            in_block = True
 
-    frontmatter_text = match.group(1)
-    result = {}
-
-    # Extract simple/block scalar fields
-    # Known top-level field names (prevents false matches on "error:" etc in values)
-    simple_fields = ['name', 'description', 'trigger', 'skip_when', 'when_to_use']
-    all_fields = simple_fields + ['sequence', 'related']
-    fields_pattern = '|'.join(all_fields)
-
-    for field in simple_fields:
-        # Match field: value OR field: | followed by indented content
-        # Capture until next known top-level field or end of frontmatter
-        # Using explicit field list prevents matching "error:" inside values
-        pattern = rf'^{field}:\s*\|?\s*\n?(.*?)(?=^(?:{fields_pattern}):|\Z)'
-        field_match = re.search(pattern, frontmatter_text, re.MULTILINE | re.DOTALL)
-        if field_match:
-            raw_value = field_match.group(1).strip()
-            if raw_value:
-                # Extract lines, clean indentation
-                lines = []
-                for line in raw_value.split('\n'):
-                    cleaned = line.strip()
-                    # Remove list marker prefix for cleaner display
-                    if cleaned.startswith('- '):
-                        cleaned = cleaned[2:]
-                    if cleaned and not cleaned.startswith('#'):
-                        lines.append(cleaned)
-                if lines:
-                    # For quick reference, use first meaningful line
-                    result[field] = lines[0]
-
-    # Handle nested structures: sequence and related
-    for nested_field in ['sequence', 'related']:
-        # Match the nested block (indented content under field:)
-        pattern = rf'^{nested_field}:\s*\n((?:[ \t]+[^\n]*\n?)+)'
-        nested_match = re.search(pattern, frontmatter_text, re.MULTILINE)
-        if nested_match:
-            nested_text = nested_match.group(1)
-            result[nested_field] = {}
-
-            # Parse sub-fields: after, before, similar, complementary
             # Format: subfield: [item1, item2] or subfield: [item1]
-            subfields = ['after', 'before', 'similar', 'complementary']
-            for subfield in subfields:
-                # Match: subfield: [contents]
-                sub_pattern = rf'^\s*{subfield}:\s*\[([^\]]*)\]'
-                sub_match = re.search(sub_pattern, nested_text, re.MULTILINE)
-                if sub_match:
-                    items_str = sub_match.group(1)
-                    # Parse comma-separated items, strip whitespace
-                    items = [s.strip() for s in items_str.split(',') if s.strip()]
+            # (after, before, similar, complementary, or any other list)
+            sub_key, sep, sub_value = line.strip().partition(':')
+            sub_value = sub_value.strip()
+            if sep and sub_key and sub_key not in nested_seen:
+                close = sub_value.find(']')
+                if sub_value.startswith('[') and close > 0:
+                    nested_seen.add(sub_key)
+                    # Parse comma-separated items, strip whitespace and quotes
+                    items = [item.strip().strip('"\'') for item in sub_value[1:close].split(',')]
+                    items = [item for item in items if item]
                     if items:
-                        result[nested_field][subfield] = items
+                        nested[sub_key] = items
 
-            # Remove empty nested dicts
-            if not result[nested_field]:
-                del result[nested_field]
+    # Remove empty nested dicts
+    for nested_field in _NESTED_FIELDS:
+        if nested_field in result and not result[nested_field]:
+            del result[nested_field]
 
     return result if result else None
 
 
-def parse_skill_file(skill_path: Path) -> Optional[Skill]:
-    """Parse a SKILL.md file and extract metadata."""
-    try:
-        with open(skill_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+def parse_skill_file(skill_path: Path, strict: bool = False) -> Optional[Skill]:
+    """Parse a SKILL.md file and extract metadata.
 
-        # Try YAML parser first, fall back to regex
-        frontmatter = parse_frontmatter_yaml(content)
-        if not frontmatter:
-            frontmatter = parse_frontmatter_fallback(content)
+    With strict=True the frontmatter is parsed with pyyaml when load_yaml()
+    has imported it.
+    """
+    try:
+        content = read_frontmatter_head(skill_path)
+
+        # Locate the frontmatter block once and hand it to the parser
+        frontmatter_text = _extract_frontmatter(content)
+        frontmatter = None
+        if frontmatter_text is not None:
+            if strict and _yaml is not None:
+                frontmatter = parse_frontmatter_yaml(frontmatter_text)
+            # Built-in parser by default, or when pyyaml rejected the block
+            if not frontmatter:
+                frontmatter = parse_frontmatter_fallback(frontmatter_text)
 
         if not frontmatter or 'name' not in frontmatter:
             print(f"Warning: Missing name in {skill_path}", file=sys.stderr)
@@ -214,26 +509,124 @@ def parse_skill_file(skill_path: Path) -> Optional[Skill]:
         return None
 
 
-def scan_skills_directory(skills_dir: Path) -> List[Skill]:
-    """Scan skills directory and parse all SKILL.md files."""
+def load_cache(cache_path: Path, strict: bool = False) -> Dict[str, Dict[str, Any]]:
+    """Load parsed skills cached by a previous run.
+
+    The cache is discarded when it was written by a different cache version
+    or parser (pyyaml vs built-in), since those produce different metadata.
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if (not isinstance(data, dict) or data.get('version') != CACHE_VERSION
+            or data.get('parser') != _parser_id(strict) or not isinstance(data.get('skills'), dict)):
+        return {}
+    return data['skills']
+
+
+def save_cache(cache_path: Path, cache: Dict[str, Dict[str, Any]], strict: bool = False) -> None:
+    """Write the parse cache atomically. Failures are ignored (cache is optional).
+
+    Values JSON cannot represent (e.g. YAML dates) are stored as strings.
+    """
+    data = {'version': CACHE_VERSION, 'parser': _parser_id(strict), 'skills': cache}
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, default=str)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _skill_from_cache(cached: Any, st: os.stat_result) -> Optional[Skill]:
+    """Rebuild a skill from its cache entry if the entry is valid and current.
+
+    Malformed entries count as misses, so the file is parsed again and the
+    entry rewritten instead of failing every run.
+    """
+    if (not isinstance(cached, dict) or cached.get('mtime_ns') != st.st_mtime_ns
+            or cached.get('size') != st.st_size or not isinstance(cached.get('skill'), dict)):
+        return None
+    try:
+        return Skill(**cached['skill'])
+    except (TypeError, AttributeError):
+        return None
+
+
+def scan_skills_directory(skills_dir: Path,
+                          cache: Optional[Dict[str, Dict[str, Any]]] = None,
+                          strict: bool = False) -> List[Skill]:
+    """Scan skills directory and parse all SKILL.md files.
+
+    If a cache dict is given, files whose (mtime_ns, size) match their cache
+    entry are rebuilt from it without parsing. The dict is updated in place to
+    hold exactly the skills found in this scan. Remaining files are parsed
+    on a thread pool; results keep directory name order. strict is passed
+    through to parse_skill_file.
+    """
     skills = []
+    previous = dict(cache) if cache is not None else {}
+    if cache is not None:
+        cache.clear()
 
     if not skills_dir.exists():
         print(f"Error: Skills directory not found: {skills_dir}", file=sys.stderr)
         return skills
 
-    for skill_dir in sorted(skills_dir.iterdir()):
-        if not skill_dir.is_dir():
-            continue
+    # DirEntry.is_dir() answers from the directory listing, and a single stat
+    # of SKILL.md both checks it exists and feeds the cache lookup
+    with os.scandir(skills_dir) as it:
+        entries = sorted(it, key=lambda e: e.name)
 
-        skill_file = skill_dir / 'SKILL.md'
-        if not skill_file.exists():
-            print(f"Warning: No SKILL.md in {skill_dir.name}", file=sys.stderr)
+    candidates = []
+    for entry in entries:
+        if not entry.is_dir():
             continue
 
-        skill = parse_skill_file(skill_file)
-        if skill:
-            skills.append(skill)
+        skill_file = Path(entry.path) / 'SKILL.md'
+        try:
+            st = os.stat(skill_file)
+        except OSError:
+            print(f"Warning: No SKILL.md in {entry.name}", file=sys.stderr)
+            continue
+        candidates.append((skill_file, st))
+
+    # Reuse cached skills for unchanged files, parse the rest
+    results: List[Optional[Skill]] = []
+    to_parse = []
+    for index, (skill_file, st) in enumerate(candidates):
+        skill = _skill_from_cache(previous.get(str(skill_file)), st)
+        results.append(skill)
+        if skill is None:
+            to_parse.append(index)
+
+    # File reads and libyaml parsing release the GIL, so threads overlap them
+    parse = partial(parse_skill_file, strict=strict)
+    if len(to_parse) > 1:
+        # Imported here: warm-cache runs parse at most one file and skip it
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as executor:
+            parsed = list(executor.map(parse, [candidates[i][0] for i in to_parse]))
+    else:
+        parsed = [parse(candidates[i][0]) for i in to_parse]
+    for index, skill in zip(to_parse, parsed):
+        results[index] = skill
+
+    for (skill_file, st), skill in zip(candidates, results):
+        if not skill:
+            continue
+        skills.append(skill)
+        if cache is not None:
+            cache[str(skill_file)] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size,
+                                      'skill': skill.to_dict()}
 
     return skills
 
@@ -249,56 +642,63 @@ def generate_markdown(skills: List[Skill]) -> str:
     if not skills:
         return "# Ring Skills Quick Reference\n\n**No skills found.**\n"
 
-    # Group skills by category
-    categorized: Dict[str, List[Skill]] = {}
-    for skill in skills:
-        category = skill.category
-        if category not in categorized:
-            categorized[category] = []
-        categorized[category].append(skill)
-
-    # Sort categories (predefined order, then Other)
-    category_order = list(CATEGORIES.keys()) + ['Other']
-    sorted_categories = [cat for cat in category_order if cat in categorized]
+    # One sort by (category order, name): predefined categories, then Other.
+    # Names compare as text, since YAML may load e.g. a date and the cache
+    # round-trips it as a string.
+    category_index = {cat: i for i, cat in enumerate(list(CATEGORIES.keys()) + ['Other'])}
+    ordered = sorted(skills, key=lambda s: (category_index.get(s.category, len(category_index)), str(s.name)))
 
-    # Build markdown
-    lines = ['# Ring Skills Quick Reference\n']
+    # Build markdown into a single buffer
+    buf = io.StringIO()
+    write = buf.write
+    write('# Ring Skills Quick Reference\n\n')
 
-    for category in sorted_categories:
-        category_skills = categorized[category]
-        lines.append(f'## {category} ({len(category_skills)} skills)\n')
+    for category, group in groupby(ordered, key=lambda s: s.category):
+        category_skills = list(group)
+        write(f'## {category} ({len(category_skills)} skills)\n\n')
 
-        for skill in sorted(category_skills, key=lambda s: s.name):
+        for skill in category_skills:
             # Skill name and description
-            lines.append(f'- **{skill.name}**: {first_line(skill.description)}')
+            write(f'- **{skill.name}**: {skill.short_description}\n')
 
-        lines.append('')  # Blank line between categories
+        write('\n')  # Blank line between categories
 
     # Add usage section
-    lines.append('## Usage\n')
-    lines.append('To use a skill: Use the Skill tool with skill name')
-    lines.append('Example: `ring-default:brainstorming`')
+    write('## Usage\n\n'
+          'To use a skill: Use the Skill tool with skill name\n'
+          'Example: `ring-default:brainstorming`')
 
-    return '\n'.join(lines)
+    return buf.getvalue()
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Generate skills quick reference from SKILL.md frontmatter.")
+    parser.add_argument('--strict', action='store_true',
+                        help="parse frontmatter with pyyaml instead of the built-in parser")
+    args = parser.parse_args()
+    if args.strict and not load_yaml():
+        print("Warning: pyyaml not installed, using built-in parser", file=sys.stderr)
+
     # Determine plugin root (parent of hooks directory)
     script_dir = Path(__file__).parent.resolve()
     plugin_root = script_dir.parent
     skills_dir = plugin_root / 'skills'
+    cache_path = plugin_root / '.cache' / 'skills-ref.json'
 
-    # Scan and parse skills
-    skills = scan_skills_directory(skills_dir)
+    # Scan and parse skills, reusing cached metadata for unchanged files
+    cache = load_cache(cache_path, args.strict)
+    skills = scan_skills_directory(skills_dir, cache, args.strict)
+    save_cache(cache_path, cache, args.strict)
 
     if not skills:
         print("Error: No valid skills found", file=sys.stderr)
         sys.exit(1)
 
-    # Generate and output markdown
+    # Generate and output markdown as UTF-8 in one write
     markdown = generate_markdown(skills)
-    print(markdown)
+    sys.stdout.buffer.write((markdown + '\n').encode('utf-8'))
+    sys.stdout.buffer.flush()
 
     # Report statistics to stderr
     print(f"Generated reference for {len(skills)} skills", file=sys.stderr)
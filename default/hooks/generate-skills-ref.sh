@@ -5,7 +5,7 @@
 # Tools used: sed, awk, grep (standard on macOS/Linux/Git Bash)
 #
 # This script provides a degraded but functional skills quick reference
-# when Python or PyYAML are not available on the system.
+# when Python is not available on the system.
 
 set -euo pipefail
 
@@ -126,7 +126,7 @@ generate_markdown() {
     echo "# Ring Skills Quick Reference"
     echo ""
     echo "> **Note:** Python unavailable. Using bash fallback parser."
-    echo "> Install Python + PyYAML for full output with categories."
+    echo "> Install Python 3 for full output with categories."
     echo ""
 
     local skill_count=0
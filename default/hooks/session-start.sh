@@ -68,29 +68,6 @@ if command -v git &> /dev/null; then
     #   claude plugin marketplace add lerianstudio/ring
 fi
 
-# Auto-install PyYAML if Python is available but PyYAML is not
-if command -v python3 &> /dev/null; then
-    if ! python3 -c "import yaml" &> /dev/null 2>&1; then
-        # PyYAML not installed, try to install it
-        # Try different pip commands (pip3 preferred, then pip)
-        for pip_cmd in pip3 pip; do
-            if command -v "$pip_cmd" &> /dev/null; then
-                # Strategy: Try --user first, then --user --break-system-packages
-                # (--break-system-packages only exists in pip 22.1+, needed for PEP 668)
-                if "$pip_cmd" install --quiet --user 'PyYAML>=6.0,<7.0' &> /dev/null 2>&1; then
-                    echo "PyYAML installed successfully" >&2
-                    break
-                elif "$pip_cmd" install --quiet --user --break-system-packages 'PyYAML>=6.0,<7.0' &> /dev/null 2>&1; then
-                    echo "PyYAML installed successfully (with --break-system-packages)" >&2
-                    break
-                fi
-            fi
-        done
-        # If all installation attempts fail, generate-skills-ref.py will use fallback parser
-        # (No error message needed - the Python script already warns about missing PyYAML)
-    fi
-fi
-
 # Critical rules that MUST survive compact (injected directly, not via skill file)
 # These are the most-violated rules that need to be in immediate context
 CRITICAL_RULES='## ⛔ ORCHESTRATOR CRITICAL RULES (SURVIVE COMPACT)
@@ -141,7 +118,7 @@ State assumption → Explain why → Note what would change it
 '
 
 # Generate skills overview with cascading fallback
-# Priority: Python+PyYAML > Python regex > Bash fallback > Error message
+# Priority: Python (built-in frontmatter parser) > Bash fallback > Error message
 generate_skills_overview() {
     local python_cmd=""
 
@@ -154,7 +131,7 @@ generate_skills_overview() {
     done
 
     if [[ -n "$python_cmd" ]]; then
-        # Python available - use Python script (handles PyYAML fallback internally)
+        # Python available - use Python script (does not need PyYAML)
         "$python_cmd" "${SCRIPT_DIR}/generate-skills-ref.py" 2>&1
         return $?
     fi
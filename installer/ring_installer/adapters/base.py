@@ -188,8 +188,10 @@ class PlatformAdapter(ABC):
             end_marker = content.find("---", 3)
             if end_marker != -1:
                 yaml_content = content[3:end_marker].strip()
+                # libyaml-backed loader when PyYAML was built with it
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
                 try:
-                    frontmatter = yaml.safe_load(yaml_content) or {}
+                    frontmatter = yaml.load(yaml_content, Loader=loader) or {}
                 except yaml.YAMLError:
                     pass
                 body = content[end_marker + 3:].strip()
@@ -17,6 +17,33 @@ from typing import Any, Dict, Optional
 
 from ring_installer.adapters.base import PlatformAdapter
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Whole-line // comments in JSONC config files
+_JSONC_LINE_COMMENT_RE = re.compile(r'^[^\S\n]*//[^\n]*\n?', re.MULTILINE)
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON text, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps_indented(obj: Any) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON, using orjson when installed.
+
+    Non-ASCII text is written as-is by both backends, so the file does not
+    depend on whether orjson is installed.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 class OpenCodeAdapter(PlatformAdapter):
     """
@@ -58,6 +85,17 @@ class OpenCodeAdapter(PlatformAdapter):
         "FetchURL": "webfetch",
     }
 
+    # Same mapping keyed by lowercase name, for case-insensitive lookups
+    _OPENCODE_TOOL_NAME_MAP_LOWER: Dict[str, str] = {
+        name.lower(): mapped for name, mapped in _OPENCODE_TOOL_NAME_MAP.items()
+    }
+
+    # Canonical tool name used as "<Name> tool" / "<Name> command", in one pass.
+    # Only the "tool"/"command" suffix is case-insensitive.
+    _TOOL_REFERENCE_RE = re.compile(
+        r'\b(' + '|'.join(re.escape(name) for name in _OPENCODE_TOOL_NAME_MAP) + r')\b(?=(?i:\s+tool|\s+command))'
+    )
+
     # Model shorthand to OpenCode model ID mapping
     _OPENCODE_MODEL_MAP: Dict[str, str] = {
         "opus": "anthropic/claude-opus-4-5",
@@ -66,6 +104,17 @@ class OpenCodeAdapter(PlatformAdapter):
         "inherit": "inherit",
     }
 
+    # Plugin-root references in hook content -> OpenCode paths
+    _HOOK_PATH_REPLACEMENTS: Dict[str, str] = {
+        "${CLAUDE_PLUGIN_ROOT}/hooks/": "bash ~/.config/opencode/hook/",
+        "$CLAUDE_PLUGIN_ROOT/hooks/": "bash ~/.config/opencode/hook/",
+        "${CLAUDE_PLUGIN_ROOT}": "~/.config/opencode",
+        "$CLAUDE_PLUGIN_ROOT": "~/.config/opencode",
+    }
+
+    # Longest forms first so ".../hooks/" wins over the bare variable
+    _HOOK_PATH_RE = re.compile("|".join(re.escape(ref) for ref in _HOOK_PATH_REPLACEMENTS))
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the OpenCode adapter.
@@ -200,12 +249,10 @@ class OpenCodeAdapter(PlatformAdapter):
         Returns:
             Transformed hook content for OpenCode
         """
-        result = hook_content.replace("${CLAUDE_PLUGIN_ROOT}/hooks/", "bash ~/.config/opencode/hook/")
-        result = result.replace("$CLAUDE_PLUGIN_ROOT/hooks/", "bash ~/.config/opencode/hook/")
-        result = result.replace("${CLAUDE_PLUGIN_ROOT}", "~/.config/opencode")
-        result = result.replace("$CLAUDE_PLUGIN_ROOT", "~/.config/opencode")
-
-        return result
+        return self._HOOK_PATH_RE.sub(
+            lambda match: self._HOOK_PATH_REPLACEMENTS[match.group(0)],
+            hook_content
+        )
 
     def get_install_path(self) -> Path:
         """
@@ -215,20 +262,23 @@ class OpenCodeAdapter(PlatformAdapter):
             Path to ~/.config/opencode directory
         """
         if self._install_path is None:
-            env_path = Path(self.config.get("install_path", "~/.config/opencode")).expanduser()
+            # Resolved once per adapter; home is looked up here rather than at
+            # import so a changed HOME (tests, sudo -E) is still honoured.
             override = os.environ.get("OPENCODE_CONFIG_PATH")
             if override:
                 candidate = Path(override).expanduser().resolve()
-                home = Path.home().resolve()
                 try:
-                    candidate.relative_to(home)
-                    env_path = candidate
+                    candidate.relative_to(Path.home().resolve())
+                    self._install_path = candidate
+                    return candidate
                 except ValueError:
                     import logging
                     logging.getLogger(__name__).warning(
                         "OPENCODE_CONFIG_PATH=%s ignored: path must be under home", override
                     )
-            self._install_path = env_path
+            self._install_path = Path(
+                self.config.get("install_path", "~/.config/opencode")
+            ).expanduser()
         return self._install_path
 
     def get_component_mapping(self) -> Dict[str, Dict[str, str]]:
@@ -301,13 +351,16 @@ class OpenCodeAdapter(PlatformAdapter):
         """
         Transform frontmatter for OpenCode compatibility.
 
+        The dictionary is modified in place (callers pass the fresh dict
+        returned by extract_frontmatter), avoiding a copy per component.
+
         Args:
             frontmatter: Original frontmatter dictionary
 
         Returns:
-            Transformed frontmatter dictionary
+            The same dictionary, transformed
         """
-        result = dict(frontmatter)
+        result = frontmatter
 
         if "model" in result:
             model = result["model"]
@@ -335,6 +388,8 @@ class OpenCodeAdapter(PlatformAdapter):
         - temperature: Response randomness
         - maxSteps: Max agentic iterations
 
+        Modifies frontmatter in place, like _transform_frontmatter.
+
         Args:
             frontmatter: Original agent frontmatter
 
@@ -366,6 +421,8 @@ class OpenCodeAdapter(PlatformAdapter):
         - subtask: Mark as subtask command
         - argument-hint: Usage hint
 
+        Modifies frontmatter in place, like _transform_frontmatter.
+
         Args:
             frontmatter: Original command frontmatter
 
@@ -400,8 +457,8 @@ class OpenCodeAdapter(PlatformAdapter):
             normalized: Dict[str, Any] = {}
             for tool, enabled in tools.items():
                 if isinstance(tool, str):
-                    mapped = self._OPENCODE_TOOL_NAME_MAP.get(tool, tool.lower())
-                    normalized[mapped] = enabled
+                    lowered = tool.lower()
+                    normalized[self._OPENCODE_TOOL_NAME_MAP_LOWER.get(lowered, lowered)] = enabled
             return normalized
 
         if isinstance(tools, list):
@@ -409,8 +466,8 @@ class OpenCodeAdapter(PlatformAdapter):
             normalized_obj: Dict[str, Any] = {}
             for tool in tools:
                 if isinstance(tool, str):
-                    mapped = self._OPENCODE_TOOL_NAME_MAP.get(tool, tool.lower())
-                    normalized_obj[mapped] = True
+                    lowered = tool.lower()
+                    normalized_obj[self._OPENCODE_TOOL_NAME_MAP_LOWER.get(lowered, lowered)] = True
                 else:
                     normalized_obj[str(tool)] = True
             return normalized_obj
@@ -422,6 +479,7 @@ class OpenCodeAdapter(PlatformAdapter):
         Normalize tool name references in content.
 
         Converts Claude Code capitalized tool names to OpenCode lowercase.
+        Names must use their canonical casing (e.g. "WebFetch tool").
 
         Args:
             text: Text containing tool references
@@ -429,15 +487,10 @@ class OpenCodeAdapter(PlatformAdapter):
         Returns:
             Text with normalized tool names
         """
-        result = text
-        for claude_name, opencode_name in self._OPENCODE_TOOL_NAME_MAP.items():
-            result = re.sub(
-                rf'\b{claude_name}\b(?=\s+tool|\s+command)',
-                opencode_name,
-                result,
-                flags=re.IGNORECASE
-            )
-        return result
+        return self._TOOL_REFERENCE_RE.sub(
+            lambda match: self._OPENCODE_TOOL_NAME_MAP[match.group(1)],
+            text
+        )
 
     def get_target_filename(self, source_filename: str, component_type: str) -> str:
         """
@@ -497,13 +550,8 @@ class OpenCodeAdapter(PlatformAdapter):
         if config_path.exists():
             try:
                 content = config_path.read_text(encoding="utf-8")
-                lines = []
-                for line in content.split("\n"):
-                    stripped = line.strip()
-                    if not stripped.startswith("//"):
-                        lines.append(line)
-                clean_content = "\n".join(lines)
-                existing_config = json.loads(clean_content) if clean_content.strip() else {}
+                clean_content = _JSONC_LINE_COMMENT_RE.sub("", content)
+                existing_config = _json_loads(clean_content) if clean_content.strip() else {}
             except Exception as e:
                 logger.warning(f"Failed to read opencode.json: {e}")
 
@@ -522,10 +570,7 @@ class OpenCodeAdapter(PlatformAdapter):
 
         try:
             config_path.parent.mkdir(parents=True, exist_ok=True)
-            config_path.write_text(
-                json.dumps(existing_config, indent=2),
-                encoding="utf-8"
-            )
+            config_path.write_bytes(_json_dumps_indented(existing_config))
             return True
         except Exception as e:
             logger.error(f"Failed to write opencode.json: {e}")
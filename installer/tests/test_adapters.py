@@ -5,6 +5,7 @@ Tests ClaudeAdapter, FactoryAdapter, CursorAdapter, ClineAdapter,
 and the get_adapter() factory function.
 """
 
+import json
 from pathlib import Path
 
 import pytest
@@ -22,6 +23,7 @@ from ring_installer.adapters import (
     list_platforms,
     register_adapter,
 )
+from ring_installer.adapters import opencode as opencode_module
 
 # ==============================================================================
 # Tests for get_adapter() factory function
@@ -887,6 +889,52 @@ tools:
         # OpenCode uses lowercase tool names
         assert "- bash" in result or "bash" in result.lower()
 
+    def test_transform_agent_normalizes_tool_references_in_body(self, adapter):
+        """transform_agent() should map every "<Tool> tool/command" reference in the body."""
+        content = """---
+name: test-agent
+---
+
+Use the Bash tool, then the MultiEdit Tool and the WebFetch command. Bash alone stays.
+"""
+        _, body = adapter.extract_frontmatter(adapter.transform_agent(content))
+
+        assert body.strip() == (
+            "Use the bash tool, then the edit Tool and the webfetch command. Bash alone stays."
+        )
+
+    def test_transform_agent_maps_model_and_tools_together(self, adapter):
+        """transform_agent() should apply model and tool mappings in one frontmatter."""
+        content = """---
+name: test-agent
+model: sonnet
+tools:
+  - Read
+---
+
+# Test Agent
+"""
+        frontmatter, _ = adapter.extract_frontmatter(adapter.transform_agent(content))
+
+        assert frontmatter == {
+            "name": "test-agent",
+            "model": "anthropic/claude-sonnet-4-5",
+            "tools": {"read": True},
+        }
+
+    def test_transform_skill_maps_tool_names_case_insensitively(self, adapter):
+        """transform_skill() should map frontmatter tool names regardless of case."""
+        content = """---
+name: test-skill
+tools: [Bash, multiedit, BrowseURL, Custom]
+---
+
+# Test Skill
+"""
+        frontmatter, _ = adapter.extract_frontmatter(adapter.transform_skill(content))
+
+        assert frontmatter["tools"] == {"bash": True, "edit": True, "webfetch": True, "custom": True}
+
     def test_get_component_mapping_singular_dirs(self, adapter):
         """get_component_mapping() should use singular directory names."""
         mapping = adapter.get_component_mapping()
@@ -908,6 +956,17 @@ tools:
         path = adapter.get_install_path()
         assert path == Path("/custom/path")
 
+    def test_get_install_path_env_override_under_home(self, tmp_path, monkeypatch):
+        """OPENCODE_CONFIG_PATH should be honoured only when under the current home."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        override = tmp_path / "opencode-alt"
+        monkeypatch.setenv("OPENCODE_CONFIG_PATH", str(override))
+        assert OpenCodeAdapter().get_install_path() == override.resolve()
+
+        monkeypatch.setenv("OPENCODE_CONFIG_PATH", "/outside/home")
+        adapter = OpenCodeAdapter({"install_path": "/custom/path"})
+        assert adapter.get_install_path() == Path("/custom/path")
+
     def test_transform_hook_replaces_plugin_variable(self, adapter):
         """OpenCodeAdapter should replace CLAUDE_PLUGIN_ROOT with OpenCode paths."""
         hook_content = '{"command": "${CLAUDE_PLUGIN_ROOT}/hooks/session-start.sh"}'
@@ -916,6 +975,16 @@ tools:
         assert "${CLAUDE_PLUGIN_ROOT}" not in result
         assert "~/.config/opencode" in result
 
+    def test_transform_hook_replaces_all_plugin_root_forms(self, adapter):
+        """transform_hook() should map braced and bare forms, with and without /hooks/."""
+        hook_content = "${CLAUDE_PLUGIN_ROOT}/hooks/a.sh $CLAUDE_PLUGIN_ROOT/hooks/b.sh ${CLAUDE_PLUGIN_ROOT}/lib $CLAUDE_PLUGIN_ROOT"
+        result = adapter.transform_hook(hook_content)
+
+        assert result == (
+            "bash ~/.config/opencode/hook/a.sh bash ~/.config/opencode/hook/b.sh "
+            "~/.config/opencode/lib ~/.config/opencode"
+        )
+
     def test_requires_hooks_in_settings_is_false(self, adapter):
         """OpenCodeAdapter supports standalone hook files."""
         assert adapter.requires_hooks_in_settings() is False
@@ -965,6 +1034,49 @@ args: <target>
         config_path = opencode_dir / "opencode.json"
         assert not config_path.exists()
 
+    def test_merge_hooks_to_config_writes_and_appends(self, adapter, tmp_path):
+        """merge_hooks_to_config() should write indented JSON and append on re-merge."""
+        hook = {"matcher": "startup", "hooks": [{"type": "command", "command": "echo hello"}]}
+        hooks_config = {"hooks": {"SessionStart": [hook]}}
+
+        assert adapter.merge_hooks_to_config(hooks_config, install_path=tmp_path) is True
+        assert adapter.merge_hooks_to_config(hooks_config, install_path=tmp_path) is True
+
+        content = (tmp_path / "opencode.json").read_text(encoding="utf-8")
+        assert content.startswith('{\n  "hooks"')
+        assert json.loads(content) == {"hooks": {"SessionStart": [hook, hook]}}
+
+    def test_merge_hooks_to_config_ignores_line_comments(self, adapter, tmp_path):
+        """merge_hooks_to_config() should drop // comment lines from existing config."""
+        (tmp_path / "opencode.json").write_text(
+            '// Ring config\n{\n  // theme\n\t// tabbed\n  "theme": "dark", "url": "http://x"\n}\n// end',
+            encoding="utf-8"
+        )
+        hooks_config = {"hooks": {"Stop": [{"hooks": []}]}}
+
+        assert adapter.merge_hooks_to_config(hooks_config, install_path=tmp_path) is True
+
+        config = json.loads((tmp_path / "opencode.json").read_text(encoding="utf-8"))
+        assert config == {"theme": "dark", "url": "http://x", "hooks": {"Stop": [{"hooks": []}]}}
+
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_merge_hooks_to_config_output_same_for_both_json_backends(
+        self, adapter, tmp_path, monkeypatch, use_orjson
+    ):
+        """merge_hooks_to_config() should write identical files with or without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(opencode_module, "ORJSON_AVAILABLE", use_orjson)
+        (tmp_path / "opencode.json").write_text('{"theme": "café", "plugins": []}', encoding="utf-8")
+        hooks_config = {"hooks": {"Stop": [{"hooks": []}]}}
+
+        assert adapter.merge_hooks_to_config(hooks_config, install_path=tmp_path) is True
+
+        assert (tmp_path / "opencode.json").read_text(encoding="utf-8") == (
+            '{\n  "theme": "café",\n  "plugins": [],\n  "hooks": {\n    "Stop": [\n'
+            '      {\n        "hooks": []\n      }\n    ]\n  }\n}'
+        )
+
 
 # ==============================================================================
 # Tests for PlatformAdapter Base Class
@@ -0,0 +1,94 @@
+"""
+Parity tests for the built-in frontmatter parser in default/hooks/generate-skills-ref.py.
+
+The hook parses SKILL.md frontmatter with its own parser by default and only
+uses pyyaml with --strict, so its scalar handling is checked against
+yaml.safe_load here: over every SKILL.md in the repository and over the
+quoted, folded, chomping and comment forms it implements.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPT_PATH = REPO_ROOT / "default" / "hooks" / "generate-skills-ref.py"
+SKILL_FILES = sorted(REPO_ROOT.glob("*/skills/*/SKILL.md"))
+
+
+@pytest.fixture(scope="module")
+def skills_ref():
+    """Load generate-skills-ref.py as a module (its file name is not importable)."""
+    spec = importlib.util.spec_from_file_location("generate_skills_ref", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def assert_matches_yaml(skills_ref, frontmatter_text: str) -> None:
+    """Built-in parser output should equal yaml.safe_load for the fields it reads."""
+    expected = yaml.safe_load(frontmatter_text)
+    result = skills_ref.parse_frontmatter_fallback(frontmatter_text) or {}
+
+    for field in skills_ref._SIMPLE_FIELDS:
+        value = expected.get(field)
+        if isinstance(value, str) and value.strip():
+            assert result.get(field) == value, field
+    for field in skills_ref._NESTED_FIELDS:
+        value = expected.get(field)
+        if isinstance(value, dict) and value:
+            assert result.get(field) == value, field
+
+
+# ==============================================================================
+# Tests against the repository's skills
+# ==============================================================================
+
+def test_repo_has_skill_files():
+    """The parity check below should have skills to run over."""
+    assert SKILL_FILES
+
+
+@pytest.mark.parametrize(
+    "skill_file", SKILL_FILES, ids=[str(p.relative_to(REPO_ROOT)) for p in SKILL_FILES]
+)
+def test_builtin_parser_matches_yaml_for_repo_skills(skills_ref, skill_file):
+    """parse_frontmatter_fallback() should agree with pyyaml on every repo SKILL.md."""
+    frontmatter_text = skills_ref._extract_frontmatter(skill_file.read_text(encoding="utf-8"))
+    if frontmatter_text is None:
+        pytest.skip("no frontmatter")
+
+    assert_matches_yaml(skills_ref, frontmatter_text)
+
+
+# ==============================================================================
+# Tests for individual scalar forms
+# ==============================================================================
+
+SCALAR_CASES = {
+    "plain": "name: x\ndescription: Plain value",
+    "plain_multiline": "name: x\ndescription: Line one\n  continued two.\n\n  New paragraph",
+    "plain_next_line": "name: x\ndescription:\n  # leading comment\n  On the next line",
+    "plain_comment": "name: a # comment\ndescription: a#b stays",
+    "single_quoted": "name: 'It''s'\ndescription: 'a # not a comment' # comment",
+    "single_quoted_multiline": "name: x\ndescription: 'spans\n  two lines'",
+    "double_quoted_escapes": 'name: "say \\"hi\\"\\tok"\ndescription: "back\\\\slash\\nnewline"',
+    "literal": "name: x\ndescription: |\n  line one\n    indented\n  line three\ntrigger: y",
+    "literal_strip": "name: x\ndescription: |-\n  line one\n  line two\n\ntrigger: y",
+    "literal_keep": "name: x\ndescription: |+\n  line one\n\n\ntrigger: y",
+    "literal_at_end": "name: x\ndescription: |\n  last field, no trailing newline",
+    "folded": "name: x\ndescription: >\n  Folded line one\n  continued two.",
+    "folded_paragraphs": "name: x\ndescription: >-\n  a\n  b\n\n  c\n    more indented\n  d",
+    "folded_keep": "name: x\ndescription: >+\n  a\n\n\ntrigger: y",
+    "nested_flow_lists": (
+        "name: x\nsequence:\n  after: [a, 'b']\n  before: [\"c\"]\nrelated:\n  similar: [d]"
+    ),
+}
+
+
+@pytest.mark.parametrize("frontmatter_text", SCALAR_CASES.values(), ids=SCALAR_CASES.keys())
+def test_builtin_parser_matches_yaml_for_scalar_forms(skills_ref, frontmatter_text):
+    """parse_frontmatter_fallback() should agree with pyyaml on each scalar form."""
+    assert_matches_yaml(skills_ref, frontmatter_text)
@@ -17,30 +17,48 @@ Security:
   - Error messages use relative paths to avoid exposing full filesystem paths.
 """
 
+import hashlib
+import json
 import os
-import re
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, TextIO
 
 try:
     import yaml
     YAML_AVAILABLE = True
+    # libyaml-backed loader is much faster; PyYAML may be built without it
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
+        print("Warning: libyaml not available, using slower pure-Python YAML loader", file=sys.stderr)
 except ImportError:
     YAML_AVAILABLE = False
     print("Warning: pyyaml not installed, using fallback parser", file=sys.stderr)
 
+# Files are read in chunks of this size until the frontmatter block is complete
+_READ_CHUNK = 8192
+
+# Parse on a thread pool only when a directory has at least this many files
+_PARALLEL_MIN_FILES = 8
+
 
 class Item:
     """Represents an agent, skill, or command with metadata."""
 
+    __slots__ = ('name', 'description', 'item_type', 'file_path', 'metadata')
+
     def __init__(self, name: str, description: str, item_type: str,
-                 file_path: str, **kwargs):
+                 file_path: str, metadata: Optional[Dict[str, Any]] = None):
         self.name = name
         self.description = description
         self.item_type = item_type  # 'agent', 'skill', 'command'
         self.file_path = file_path
-        self.metadata = kwargs  # Store additional fields like type, model, etc.
+        # Additional frontmatter fields like type, model, etc.
+        self.metadata = metadata if metadata is not None else {}
 
     def __repr__(self):
         return f"Item(name={self.name}, type={self.item_type})"
@@ -49,6 +67,17 @@ class Item:
 # Module-level variable for monorepo root (set in main)
 _monorepo_root: Optional[Path] = None
 
+# Parsed-item cache shared across runs, one JSON file per scanned directory.
+# Entries map file path -> {mtime_ns, size, name, description, metadata}.
+# _parse_cache holds entries loaded from disk (set in main, left None when
+# there is no home directory to keep it in); _parse_cache_new collects the
+# entries for this run and is what gets written back when any file was
+# (re)parsed or removed.
+_CACHE_VERSION = 1
+_parse_cache: Optional[Dict[str, Dict[str, Any]]] = None
+_parse_cache_new: Dict[str, Dict[str, Any]] = {}
+_parse_cache_dirty = False
+
 
 def relative_path(file_path: Path) -> str:
     """Get path relative to monorepo root for cleaner error messages.
@@ -67,6 +96,52 @@ def relative_path(file_path: Path) -> str:
     return file_path.name
 
 
+def cache_path_for(directory: Path, item_type: str) -> Path:
+    """Get the cache file for one (item type, directory) scan.
+
+    Raises RuntimeError or KeyError if the home directory cannot be found.
+    """
+    digest = hashlib.sha1(f"{item_type}:{directory}".encode('utf-8')).hexdigest()[:16]
+    return Path.home() / '.cache' / 'ring' / f"refcache-{digest}.json"
+
+
+def load_parse_cache(cache_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Load cached items, or an empty cache if missing, stale or unreadable.
+
+    Entries are only valid for the parser that produced them (pyyaml vs
+    fallback), so a cache written by the other parser is discarded.
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if (not isinstance(data, dict) or data.get('version') != _CACHE_VERSION
+            or data.get('yaml') != YAML_AVAILABLE or not isinstance(data.get('items'), dict)):
+        return {}
+    return data['items']
+
+
+def save_parse_cache(cache_path: Path, items: Dict[str, Dict[str, Any]]) -> None:
+    """Atomically write the item cache. Failures are ignored (cache is optional).
+
+    Metadata values JSON cannot represent (e.g. YAML dates) are stored as
+    strings; output only uses name and description, which are strings.
+    """
+    data = {'version': _CACHE_VERSION, 'yaml': YAML_AVAILABLE, 'items': items}
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, default=str)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
 def validate_directory(directory: Path, monorepo_root: Path) -> Path:
     """Validate directory is within monorepo root to prevent path traversal.
 
@@ -94,31 +169,62 @@ def validate_directory(directory: Path, monorepo_root: Path) -> Path:
         sys.exit(1)
 
 
-def parse_frontmatter_yaml(content: str) -> Optional[Dict[str, Any]]:
-    """Parse YAML frontmatter using pyyaml library."""
-    if not YAML_AVAILABLE:
+def extract_frontmatter(content: str) -> Optional[str]:
+    """Return the text between the opening and closing --- delimiter lines.
+
+    Plain string searches instead of a DOTALL regex; files that do not start
+    with --- are rejected without scanning. Returns None if there is no
+    complete frontmatter block.
+    """
+    if not content.startswith('---'):
         return None
+    nl = content.find('\n', 3)
+    if nl < 0 or content[3:nl].strip():
+        return None
+
+    # Closing delimiter is a full line holding only --- (plus whitespace)
+    end = content.find('\n---', nl)
+    while end >= 0:
+        line_end = content.find('\n', end + 4)
+        if line_end < 0:
+            return None
+        if not content[end + 4:line_end].strip():
+            return content[nl + 1:end]
+        end = content.find('\n---', end + 1)
+    return None
+
+
+def read_frontmatter_head(file_path: Path) -> str:
+    """Read the start of a file, just far enough to cover its frontmatter.
 
-    # Extract frontmatter between --- delimiters
-    match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-    if not match:
+    Frontmatter lives at the top of the file, so long markdown bodies are
+    not read. Files without an opening --- get a single chunk.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read(_READ_CHUNK)
+        while content.startswith('---') and extract_frontmatter(content) is None:
+            more = f.read(_READ_CHUNK)
+            if not more:
+                break
+            content += more
+    return content
+
+
+def parse_frontmatter_yaml(frontmatter_text: str) -> Optional[Dict[str, Any]]:
+    """Parse YAML frontmatter using pyyaml library."""
+    if not YAML_AVAILABLE:
         return None
 
     try:
-        frontmatter = yaml.safe_load(match.group(1))
+        frontmatter = yaml.load(frontmatter_text, Loader=_YamlLoader)
         return frontmatter if isinstance(frontmatter, dict) else None
     except yaml.YAMLError as e:
         print(f"Warning: YAML parse error: {e}", file=sys.stderr)
         return None
 
 
-def parse_frontmatter_fallback(content: str) -> Optional[Dict[str, Any]]:
-    """Fallback parser using regex when pyyaml unavailable."""
-    match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-    if not match:
-        return None
-
-    frontmatter_text = match.group(1)
+def parse_frontmatter_fallback(frontmatter_text: str) -> Optional[Dict[str, Any]]:
+    """Fallback parser when pyyaml unavailable."""
     result = {}
 
     # Parse simple key: value pairs
@@ -139,13 +245,39 @@ def parse_frontmatter_fallback(content: str) -> Optional[Dict[str, Any]]:
 
 
 def parse_item_file(file_path: Path, item_type: str) -> Optional[Item]:
-    """Parse a .md file and extract metadata."""
+    """Parse a .md file and extract metadata.
+
+    When the parse cache is loaded, files whose mtime and size match their
+    cache entry are rebuilt from it without reading the file.
+    """
+    global _parse_cache_dirty
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        st = None
+        if _parse_cache is not None:
+            st = os.stat(file_path)
+            key = str(file_path)
+            entry = _parse_cache.get(key)
+            # Malformed entries are treated as misses and the file re-parsed
+            if (isinstance(entry, dict) and entry.get('mtime_ns') == st.st_mtime_ns
+                    and entry.get('size') == st.st_size and 'name' in entry
+                    and 'description' in entry and isinstance(entry.get('metadata'), dict)):
+                _parse_cache_new[key] = entry
+                return Item(
+                    name=entry['name'],
+                    description=entry['description'],
+                    item_type=item_type,
+                    file_path=key,
+                    metadata=entry['metadata']
+                )
+
+        # Extract frontmatter once; body-only files skip both parsers
+        frontmatter_text = extract_frontmatter(read_frontmatter_head(file_path))
+        if frontmatter_text is None:
+            print(f"Warning: No valid frontmatter in {relative_path(file_path)}", file=sys.stderr)
+            return None
 
         # Try YAML parser first, fallback to regex
-        frontmatter = parse_frontmatter_yaml(content) or parse_frontmatter_fallback(content)
+        frontmatter = parse_frontmatter_yaml(frontmatter_text) or parse_frontmatter_fallback(frontmatter_text)
 
         if not frontmatter or 'name' not in frontmatter:
             print(f"Warning: No valid frontmatter in {relative_path(file_path)}", file=sys.stderr)
@@ -161,12 +293,23 @@ def parse_item_file(file_path: Path, item_type: str) -> Optional[Item]:
         elif '\n' in description:
             description = description.split('\n')[0].strip()
 
+        metadata = {k: v for k, v in frontmatter.items() if k not in ['name', 'description']}
+        if st is not None:
+            _parse_cache_dirty = True
+            _parse_cache_new[str(file_path)] = {
+                'mtime_ns': st.st_mtime_ns,
+                'size': st.st_size,
+                'name': name,
+                'description': description,
+                'metadata': metadata,
+            }
+
         return Item(
             name=name,
             description=description,
             item_type=item_type,
             file_path=str(file_path),
-            **{k: v for k, v in frontmatter.items() if k not in ['name', 'description']}
+            metadata=metadata
         )
 
     except Exception as e:
@@ -191,108 +334,130 @@ def scan_directory(directory: Path, pattern: str, item_type: str) -> List[Item]:
         print(f"Warning: Skipping symlink directory {relative_path(directory)}", file=sys.stderr)
         return items
 
+    # One scandir pass: DirEntry answers symlink/dir checks from the listing
+    with os.scandir(directory) as it:
+        entries = sorted(it, key=lambda e: e.name)
+
     # For agents: scan *.md directly in directory
     # For skills/commands: scan subdirs for SKILL.md or *.md
-    if item_type == 'agent':
-        for file_path in sorted(directory.glob('*.md')):
+    candidates: List[Path] = []
+    if item_type == 'skill':
+        # Skills: look for SKILL.md in subdirectories
+        for entry in entries:
+            # Security: Skip symlink directories
+            if entry.is_symlink():
+                print(f"Warning: Skipping symlink directory {relative_path(Path(entry.path))}", file=sys.stderr)
+                continue
+            if not entry.is_dir():
+                continue
+            skill_file = os.path.join(entry.path, 'SKILL.md')
+            # A single lstat tells whether SKILL.md exists and is a symlink
+            try:
+                st = os.lstat(skill_file)
+            except OSError:
+                continue
+            # Security: Skip symlink files
+            if stat.S_ISLNK(st.st_mode):
+                print(f"Warning: Skipping symlink {relative_path(Path(skill_file))}", file=sys.stderr)
+                continue
+            candidates.append(Path(skill_file))
+    else:
+        # Agents and commands: *.md directly in directory
+        for entry in entries:
+            if not entry.name.endswith('.md'):
+                continue
             # Security: Skip symlinks to prevent following malicious links
-            if file_path.is_symlink():
-                print(f"Warning: Skipping symlink {relative_path(file_path)}", file=sys.stderr)
+            if entry.is_symlink():
+                print(f"Warning: Skipping symlink {relative_path(Path(entry.path))}", file=sys.stderr)
+                continue
+            if not entry.is_file():
                 continue
+            candidates.append(Path(entry.path))
+
+    # Files are independent: overlap reads and YAML parsing on a thread pool,
+    # unless there are too few files to be worth starting one
+    if len(candidates) >= _PARALLEL_MIN_FILES:
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parsed = executor.map(parse_item_file, candidates, [item_type] * len(candidates))
+            items.extend(item for item in parsed if item)
+    else:
+        for file_path in candidates:
             item = parse_item_file(file_path, item_type)
             if item:
                 items.append(item)
-    else:
-        # Skills: look for SKILL.md in subdirectories
-        # Commands: look for *.md in directory
-        if item_type == 'skill':
-            for subdir in sorted(directory.iterdir()):
-                # Security: Skip symlink directories
-                if subdir.is_symlink():
-                    print(f"Warning: Skipping symlink directory {relative_path(subdir)}", file=sys.stderr)
-                    continue
-                if subdir.is_dir():
-                    skill_file = subdir / 'SKILL.md'
-                    # Security: Skip symlink files
-                    if skill_file.exists() and not skill_file.is_symlink():
-                        item = parse_item_file(skill_file, item_type)
-                        if item:
-                            items.append(item)
-                    elif skill_file.is_symlink():
-                        print(f"Warning: Skipping symlink {relative_path(skill_file)}", file=sys.stderr)
-        else:  # commands
-            for file_path in sorted(directory.glob('*.md')):
-                # Security: Skip symlinks
-                if file_path.is_symlink():
-                    print(f"Warning: Skipping symlink {relative_path(file_path)}", file=sys.stderr)
-                    continue
-                item = parse_item_file(file_path, item_type)
-                if item:
-                    items.append(item)
 
     return items
 
 
-def format_agents_table(items: List[Item]) -> str:
-    """Format agents as markdown table grouped by type."""
+def format_agents_table(items: List[Item], out: TextIO) -> None:
+    """Write agents to out as markdown tables grouped by type."""
     if not items:
-        return "No agents found"
-
-    # Group by type if available
-    backend = [i for i in items if 'backend' in i.name.lower()]
-    frontend = [i for i in items if 'frontend' in i.name.lower()]
-    infra = [i for i in items if i not in backend and i not in frontend]
+        out.write("No agents found\n")
+        return
 
-    output = []
+    # Group by type in one pass (a name with both words is listed in both)
+    backend: List[Item] = []
+    frontend: List[Item] = []
+    infra: List[Item] = []
+    for item in items:
+        name = item.name.lower()
+        is_backend = 'backend' in name
+        is_frontend = 'frontend' in name
+        if is_backend:
+            backend.append(item)
+        if is_frontend:
+            frontend.append(item)
+        if not (is_backend or is_frontend):
+            infra.append(item)
+
+    write = out.write
 
     if backend:
-        output.append("**Backend Engineers:**")
-        output.append("| Agent | Expertise |")
-        output.append("|-------|-----------|")
+        write("**Backend Engineers:**\n"
+              "| Agent | Expertise |\n"
+              "|-------|-----------|\n")
         for item in backend:
-            output.append(f"| `{item.name}` | {item.description} |")
-        output.append("")
+            write(f"| `{item.name}` | {item.description} |\n")
+        write("\n")
 
     if frontend:
-        output.append("**Frontend Engineers:**")
-        output.append("| Agent | Expertise |")
-        output.append("|-------|-----------|")
+        write("**Frontend Engineers:**\n"
+              "| Agent | Expertise |\n"
+              "|-------|-----------|\n")
         for item in frontend:
-            output.append(f"| `{item.name}` | {item.description} |")
-        output.append("")
+            write(f"| `{item.name}` | {item.description} |\n")
+        write("\n")
 
     if infra:
-        output.append("**Infrastructure & Quality:**")
-        output.append("| Agent | Expertise |")
-        output.append("|-------|-----------|")
+        write("**Infrastructure & Quality:**\n"
+              "| Agent | Expertise |\n"
+              "|-------|-----------|\n")
         for item in infra:
-            output.append(f"| `{item.name}` | {item.description} |")
-
-    return "\n".join(output)
+            write(f"| `{item.name}` | {item.description} |\n")
 
 
-def format_skills_list(items: List[Item]) -> str:
-    """Format skills as categorized list."""
+def format_skills_list(items: List[Item], out: TextIO) -> None:
+    """Write skills to out as a list."""
     if not items:
-        return "No skills found"
+        out.write("No skills found\n")
+        return
 
-    output = []
     for item in items:
-        output.append(f"- `{item.name}`: {item.description}")
+        out.write(f"- `{item.name}`: {item.description}\n")
 
-    return "\n".join(output)
 
-
-def format_commands_list(items: List[Item]) -> str:
-    """Format commands as table."""
+def format_commands_list(items: List[Item], out: TextIO) -> None:
+    """Write commands to out as a table."""
     if not items:
-        return "No commands found"
+        out.write("No commands found\n")
+        return
 
-    output = ["| Command | Purpose |", "|---------|---------|"]
+    write = out.write
+    write("| Command | Purpose |\n"
+          "|---------|---------|\n")
     for item in items:
-        output.append(f"| `{item.name}` | {item.description} |")
-
-    return "\n".join(output)
+        write(f"| `{item.name}` | {item.description} |\n")
 
 
 def main():
@@ -316,20 +481,29 @@ def main():
     # Normalize to singular
     item_type_singular = item_type.rstrip('s')
 
-    # Scan directory
+    # Scan directory, reusing cached items for unchanged files. Without a
+    # home directory to keep the cache in, every file is parsed.
+    global _parse_cache
+    try:
+        cache_path: Optional[Path] = cache_path_for(directory, item_type_singular)
+    except (RuntimeError, KeyError):
+        cache_path = None
+    _parse_cache = load_parse_cache(cache_path) if cache_path is not None else None
     items = scan_directory(directory, '*.md', item_type_singular)
+    if _parse_cache is not None and (_parse_cache_dirty or _parse_cache_new.keys() != _parse_cache.keys()):
+        save_parse_cache(cache_path, _parse_cache_new)
 
     if not items:
         print(f"No {item_type} found in {relative_path(directory)}", file=sys.stderr)
         sys.exit(1)
 
-    # Format output based on type
+    # Format output based on type, written straight to stdout
     if item_type == 'agents':
-        print(format_agents_table(items))
+        format_agents_table(items, sys.stdout)
     elif item_type == 'skills':
-        print(format_skills_list(items))
+        format_skills_list(items, sys.stdout)
     else:  # commands
-        print(format_commands_list(items))
+        format_commands_list(items, sys.stdout)
 
 
 if __name__ == '__main__':